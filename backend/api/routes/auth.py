@@ -19,8 +19,9 @@ from utils.auth import (
     verify_password,
     create_access_token,
     get_current_user,
+    invalidate_user_cache,
 )
-from utils.config import settings
+from utils.config import get_settings
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 logger = logging.getLogger(__name__)
@@ -31,8 +32,6 @@ logger = logging.getLogger(__name__)
 )
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
     # Check if user already exists
-    existing_user = db.query(User).filter(
-        User.email == user_data.email).first()
     existing_user = db.query(User).filter(
         User.email == user_data.email).first()
     if existing_user:
@@ -46,7 +45,6 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         email=user_data.email,
         password_hash=hashed_password,
         name=user_data.name,
-        name=user_data.name,
         role=user_data.role,
     )
 
@@ -76,13 +74,10 @@ def login(login_data: UserLogin, db: Session = Depends(get_db)):
 
     # Create access token
     access_token_expires = timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    # Create access token
-    access_token_expires = timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        minutes=get_settings().ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email, "role": user.role}, expires_delta=access_token_expires
+        data={"sub": user.email, "user_id": str(user.id), "role": user.role},
+        expires_delta=access_token_expires,
     )
 
     # Create refresh token
@@ -98,6 +93,8 @@ def login(login_data: UserLogin, db: Session = Depends(get_db)):
     )
     db.add(session)
     db.commit()
+    # last_login changed; drop any cached snapshot of the old row
+    invalidate_user_cache(user.email)
 
     logger.info(f"User logged in: {user.email} (ID: {user.id})")
 
@@ -127,12 +124,6 @@ def logout(
         UserSession.user_id == current_user.id).delete()
     db.commit()
 
-    logger.info(
-        f"User logged out: {current_user.email} (ID: {current_user.id})")
-    db.query(UserSession).filter(
-        UserSession.user_id == current_user.id).delete()
-    db.commit()
-
     logger.info(
         f"User logged out: {current_user.email} (ID: {current_user.id})")
 
@@ -161,14 +152,7 @@ def update_current_user(
 
     db.commit()
     db.refresh(current_user)
-    full_name: str = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-
-    if full_name:
-        current_user.full_name = full_name
-        db.commit()
-        db.refresh(current_user)
-        logger.info(f"User profile updated: {current_user.email}")
+    invalidate_user_cache(current_user.email)
+    logger.info(f"User profile updated: {current_user.email}")
 
     return current_user
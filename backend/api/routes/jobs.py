@@ -4,14 +4,14 @@ Jobs API routes for triggering and monitoring OCR processing.
 
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from database.config import get_db
 from database.models.user import User
 from database.models.video import Video, HighlightJob, VideoStatus
 from schemas.video import JobTriggerRequest, JobStatusResponse, JobResultResponse
-from services.ocr_task import run_ocr_processing
+from services.ocr_task import enqueue_ocr_processing, retry_backoff_seconds
 from utils.auth import get_current_user, require_role
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -21,7 +21,6 @@ logger = logging.getLogger(__name__)
 @router.post("/trigger", response_model=JobStatusResponse, status_code=status.HTTP_202_ACCEPTED)
 def trigger_ocr_job(
     request: JobTriggerRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role(["ADMIN", "COACH"])),
 ):
@@ -78,8 +77,8 @@ def trigger_ocr_job(
     
     logger.info(f"Triggering OCR job for video {video.id} by user {current_user.email}")
     
-    # Trigger background processing
-    background_tasks.add_task(run_ocr_processing, video.id, request.config)
+    # Queue on the dedicated OCR worker pool
+    enqueue_ocr_processing(video.id, request.config)
     
     return JobStatusResponse(
         id=job.id,
@@ -254,7 +253,6 @@ def get_job_result(
 def retry_failed_job(
     video_id: str,
     config: Optional[dict] = None,
-    background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role(["ADMIN", "COACH"])),
 ):
@@ -310,11 +308,12 @@ def retry_failed_job(
     db.commit()
     db.refresh(job)
     
-    logger.info(f"Retrying OCR job for video {video.id} (attempt {job.retry_count + 1})")
+    # Exponential backoff between attempts, capped at 5 minutes
+    delay = retry_backoff_seconds(job.retry_count)
+    logger.info(f"Retrying OCR job for video {video.id} (attempt {job.retry_count + 1}) in {delay}s")
     
-    # Trigger background processing
-    if background_tasks:
-        background_tasks.add_task(run_ocr_processing, video.id, config)
+    # Queue on the dedicated OCR worker pool
+    enqueue_ocr_processing(video.id, config, delay=delay)
     
     return JobStatusResponse(
         id=job.id,
@@ -20,9 +20,9 @@ import shutil
 import uuid
 import os
 
-from utils.config import settings
+from utils.config import get_settings
 from utils.auth import get_current_user, get_optional_user, require_role
-from utils.youtube import download_youtube_video, validate_youtube_url
+from utils.youtube import download_youtube_video_async, parse_youtube_url
 from database.config import get_db
 from database.models.user import User
 from database.models.video import Video, HighlightEvent, HighlightJob, VideoStatus, VideoVisibility
@@ -207,7 +207,8 @@ async def upload_youtube_video(
     4. Creates video record with metadata
     """
     # Validate YouTube URL
-    if not validate_youtube_url(url):
+    youtube_id = parse_youtube_url(url)
+    if youtube_id is None:
         raise HTTPException(
             status_code=400,
             detail="Invalid YouTube URL. Please provide a valid YouTube video link."
@@ -225,8 +226,8 @@ async def upload_youtube_video(
     
     # Download video from YouTube
     try:
-        logger.info(f"Downloading YouTube video: {url}")
-        download_result = download_youtube_video(
+        logger.info(f"Downloading YouTube video {youtube_id}: {url}")
+        download_result = await download_youtube_video_async(
             url=url,
             output_dir=UPLOAD_DIR,
             video_id=video_id,
@@ -654,6 +655,7 @@ def get_video_events(
             timestamp_seconds=e.timestamp_seconds,
             score_before=e.score_before,
             score_after=e.score_after,
+            description=e.description,
             overs=e.overs,
             clip_path=e.clip_path,
             clip_duration_seconds=e.clip_duration_seconds,
@@ -814,7 +816,7 @@ def process_video_task(
 
         # Step 1: Download video
         logger.info(f"[Job {job_id}] Step 1/3: Downloading video...")
-        video_info = download_video(video_url, settings.STORAGE_RAW_PATH)
+        video_info = download_video(video_url, get_settings().STORAGE_RAW_PATH)
         video_id = video_info["video_id"]
         logger.info(f"[Job {job_id}] Downloaded video: {video_id}")
 
@@ -836,8 +838,8 @@ def process_video_task(
         clips = generate_highlights(
             video_id=video_id,
             events=events,
-            raw_folder=settings.STORAGE_RAW_PATH,
-            output_folder=settings.STORAGE_TRIMMED_PATH,
+            raw_folder=get_settings().STORAGE_RAW_PATH,
+            output_folder=get_settings().STORAGE_TRIMMED_PATH,
             merge_threshold=merge_threshold,
         )
 
@@ -948,7 +950,7 @@ async def get_highlights(video_id: str, current_user: User = Depends(get_current
         from pathlib import Path
 
         manifest_path = (
-            Path(settings.STORAGE_TRIMMED_PATH) / f"{video_id}_manifest.json"
+            Path(get_settings().STORAGE_TRIMMED_PATH) / f"{video_id}_manifest.json"
         )
 
         if not manifest_path.exists():
@@ -1045,7 +1047,7 @@ async def create_reel(
         _, _, _, create_highlight_reel = get_engine_functions()
 
         # Construct video path
-        video_path = Path(settings.STORAGE_RAW_PATH) / f"{video_id}.mp4"
+        video_path = Path(get_settings().STORAGE_RAW_PATH) / f"{video_id}.mp4"
 
         if not video_path.exists():
             raise HTTPException(
@@ -1,5 +1,6 @@
 import os
 import logging
+import orjson
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -26,6 +27,18 @@ if not DATABASE_URL:
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON columns (e.g. events_detected) with orjson."""
+    return orjson.dumps(obj).decode()
+
+
+# JSON column (de)serialization shared by all engines
+_JSON_ENGINE_KWARGS = {
+    'json_serializer': _json_serializer,
+    'json_deserializer': orjson.loads,
+}
+
 # Create engine based on database type
 if IS_SQLITE:
     # SQLite config - simpler settings
@@ -33,6 +46,7 @@ if IS_SQLITE:
         DATABASE_URL,
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
+        **_JSON_ENGINE_KWARGS,
     )
     background_engine = engine  # Use same engine for SQLite
 else:
@@ -51,7 +65,8 @@ else:
             'keepalives_idle': 30,
             'keepalives_interval': 10,
             'keepalives_count': 5,
-        }
+        },
+        **_JSON_ENGINE_KWARGS,
     )
 
     # Separate engine for background tasks (OCR processing)
@@ -69,7 +84,8 @@ else:
             'keepalives_idle': 60,
             'keepalives_interval': 15,
             'keepalives_count': 5,
-        }
+        },
+        **_JSON_ENGINE_KWARGS,
     )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -139,6 +139,18 @@ class HighlightEvent(Base):
     def __repr__(self):
         return f"<HighlightEvent {self.event_type} at {self.timestamp_seconds}s>"
 
+    @property
+    def description(self) -> str | None:
+        """
+        Score change for display, e.g. 'Score: 145/3 → 151/3'.
+
+        Mirrors ocr_engine.describe_event over the stored, already formatted
+        scores; ocr_engine isn't imported here since it loads cv2/EasyOCR.
+        """
+        if self.score_before is None or self.score_after is None:
+            return None
+        return f"Score: {self.score_before} → {self.score_after}"
+
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses"""
         return {
@@ -147,6 +159,7 @@ class HighlightEvent(Base):
             "timestamp_seconds": self.timestamp_seconds,
             "score_before": self.score_before,
             "score_after": self.score_after,
+            "description": self.description,
             "overs": self.overs,
             "clip_path": self.clip_path,
             "clip_duration_seconds": self.clip_duration_seconds,
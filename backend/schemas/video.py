@@ -84,6 +84,7 @@ class HighlightEventResponse(BaseModel):
     timestamp_seconds: float
     score_before: Optional[str]
     score_after: Optional[str]
+    description: Optional[str] = None
     overs: Optional[str]
     clip_path: Optional[str]
     clip_duration_seconds: Optional[float]
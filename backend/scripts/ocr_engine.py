@@ -17,8 +17,9 @@ import logging
 import argparse
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from collections import deque
+from typing import List, Dict, Iterator, Optional, Tuple
+
+import numpy as np
 
 try:
     import easyocr
@@ -82,15 +83,34 @@ class ScoreboardConfig:
 
 
 # DATA MODELS
+def format_score(runs: int, wickets: int) -> str:
+    """Format a score as '145/3' (or '145' in runs-only mode)."""
+    return f"{runs}/{wickets}" if wickets >= 0 else str(runs)
+
+
+def describe_event(event: Dict) -> str:
+    """Human-readable score change for an event dict, e.g. 'Score: 100/2 → 104/2'."""
+    before = format_score(event['runs_before'], event['wickets_before'])
+    after = format_score(event['runs_after'], event['wickets_after'])
+    return f"Score: {before} → {after}"
+
+
 class ScoreState:
     """Immutable cricket score representation."""
 
+    __slots__ = ('runs', 'wickets')
+
     def __init__(self, runs: int = 0, wickets: int = 0):
         self.runs = runs
         self.wickets = wickets  # -1 = runs-only mode
 
+    @property
+    def packed(self) -> int:
+        """Score as one int: runs << 10 | wickets (runs-only mode packs as 1023)."""
+        return (self.runs << 10) | (self.wickets & 0x3FF)
+
     def __repr__(self) -> str:
-        return f"{self.runs}/{self.wickets}" if self.wickets >= 0 else str(self.runs)
+        return format_score(self.runs, self.wickets)
 
     def __eq__(self, other) -> bool:
         if other is None:
@@ -98,7 +118,7 @@ class ScoreState:
         return self.runs == other.runs and self.wickets == other.wickets
 
     def __hash__(self) -> int:
-        return hash((self.runs, self.wickets))
+        return hash(self.packed)
 
 
 # TEXT PARSING (Separator-Agnostic, Wicket-Prioritized)
@@ -167,7 +187,7 @@ def parse_score(text: str, prev_wickets: Optional[int] = None) -> Optional[Score
     if space_match:
         runs, wickets = int(space_match.group(1)), int(space_match.group(2))
         if runs <= 999 and 0 <= wickets <= 10:
-            logger.debug(f"Parsed space-separated: '{original}' -> {runs}/{wickets}")
+            logger.debug("Parsed space-separated: '%s' -> %d/%d", original, runs, wickets)
             return ScoreState(runs, wickets)
     
     # === STRATEGY 3: Last-digit heuristic for concatenated strings ===
@@ -181,7 +201,7 @@ def parse_score(text: str, prev_wickets: Optional[int] = None) -> Optional[Score
             if runs_str and len(runs_str) <= 3:
                 runs = int(runs_str)
                 if runs <= 999:
-                    logger.debug(f"Parsed last-digit heuristic: '{original}' -> {runs}/{last_digit}")
+                    logger.debug("Parsed last-digit heuristic: '%s' -> %d/%d", original, runs, last_digit)
                     return ScoreState(runs, last_digit)
     
     # === STRATEGY 4: Runs-only fallback ===
@@ -194,15 +214,23 @@ def parse_score(text: str, prev_wickets: Optional[int] = None) -> Optional[Score
 
 
 # OCR ENGINE
+def create_easyocr_reader(use_gpu: bool = False) -> "easyocr.Reader":
+    """Load the EasyOCR model (slow: loads detection + recognition weights)."""
+    reader = easyocr.Reader(['en'], gpu=use_gpu)
+    logger.info(f"EasyOCR initialized (GPU: {use_gpu})")
+    return reader
+
+
 class OCRScoreReader:
     """Reads cricket scores from video frames using EasyOCR."""
 
     UPSCALE = 3
     OCR_ALLOWLIST = '0123456789/.' 
-    def __init__(self, config: ScoreboardConfig, use_gpu: bool = False):
+    def __init__(self, config: ScoreboardConfig, use_gpu: bool = False, reader: Optional["easyocr.Reader"] = None):
         self.config = config
-        self.reader = easyocr.Reader(['en'], gpu=use_gpu)
-        logger.info(f"EasyOCR initialized (GPU: {use_gpu})")
+        if reader is None:
+            reader = create_easyocr_reader(use_gpu)
+        self.reader = reader
 
     def _preprocess(self, roi) -> any:
         """Preprocessing pipeline: grayscale -> upscale -> blur -> CLAHE -> OTSU -> invert -> morph."""
@@ -233,7 +261,7 @@ class OCRScoreReader:
 
             return processed
         except Exception as e:
-            logger.debug(f"ROI extraction error: {e}")
+            logger.debug("ROI extraction error: %s", e)
             return None
 
     def extract_score_roi(self, frame, debug_path: Optional[str] = None) -> Optional[any]:
@@ -266,12 +294,12 @@ class OCRScoreReader:
             avg_conf = sum(confidences) / len(confidences)
 
             if avg_conf < min_confidence:
-                logger.debug(f"Low confidence ({avg_conf:.2f}): '{raw_text}'")
+                logger.debug("Low confidence (%.2f): '%s'", avg_conf, raw_text)
                 return None, avg_conf, raw_text
 
             return parse_score(raw_text, prev_wickets), avg_conf, raw_text
         except Exception as e:
-            logger.debug(f"OCR error: {e}")
+            logger.debug("OCR error: %s", e)
             return None, 0.0, "<error>"
 
     def read_overs(self, roi_image) -> Optional[Tuple[int, int]]:
@@ -281,7 +309,7 @@ class OCRScoreReader:
             text = ' '.join(results) if results else ""
             return parse_overs(text) if text.strip() else None
         except Exception as e:
-            logger.debug(f"Overs OCR error: {e}")
+            logger.debug("Overs OCR error: %s", e)
             return None
 
 
@@ -293,7 +321,9 @@ class EventDetector:
     """
 
     MAX_RUNS_PER_BALL = 8
+    SIX_RUN_DIFFS = frozenset((5, 6, 7))  # Fuzzy: OCR misreads '6' as '5'/'8'
     RESET_PERSISTENCE_SECONDS = 60.0
+    SMALL_WINDOW = 8  # Up to this history size the median is taken in pure Python
 
     def __init__(self, cooldown_seconds: float = 10.0, history_size: int = 5):
         self.cooldown = cooldown_seconds
@@ -305,18 +335,53 @@ class EventDetector:
         self.last_event_time = -999.0
         self.last_stable_score: Optional[ScoreState] = None
         self.last_over: Optional[Tuple[int, int]] = None
-        self.runs_history: deque = deque(maxlen=self.history_size)
-        self.wickets_history: deque = deque(maxlen=self.history_size)
+        # Fixed-size ring buffer of recent (runs, wickets) readings
+        self._history = np.zeros((self.history_size, 2), dtype=np.int32)
+        self._history_idx = 0
+        self._history_len = 0
+        # Median of the current window; dropped only when the window changes
+        self._median_cache: Optional[ScoreState] = None
         self.reset_candidate: Optional[ScoreState] = None
         self.reset_candidate_time = 0.0
 
+    def _push_history(self, score: ScoreState):
+        """Write a reading into the ring buffer, overwriting the oldest slot."""
+        slot = self._history[self._history_idx]
+        # A stable scoreboard evicts the same reading it adds, leaving the
+        # window (and its median) unchanged
+        if self._history_len < self.history_size or slot[0] != score.runs or slot[1] != score.wickets:
+            slot[0] = score.runs
+            slot[1] = score.wickets
+            self._median_cache = None
+        self._history_idx = (self._history_idx + 1) % self.history_size
+        if self._history_len < self.history_size:
+            self._history_len += 1
+
     def _get_median_score(self) -> Optional[ScoreState]:
         """Calculate median score from history buffer."""
-        if len(self.runs_history) < self.history_size:
+        if self._history_len < self.history_size:
             return None
-        median_runs = sorted(self.runs_history)[self.history_size // 2]
-        valid_wickets = [w for w in self.wickets_history if w >= 0]
-        median_wickets = sorted(valid_wickets)[len(valid_wickets) // 2] if valid_wickets else 0
+        if self._median_cache is None:
+            self._median_cache = self._compute_median()
+        return self._median_cache
+
+    def _compute_median(self) -> ScoreState:
+        """Median runs and median valid wickets over the full window."""
+        mid = self.history_size // 2
+        if self.history_size <= self.SMALL_WINDOW:
+            # Sorting a handful of Python ints beats numpy call overhead
+            rows = self._history.tolist()
+            runs = sorted([r for r, _ in rows])
+            valid = sorted([w for _, w in rows if w >= 0])
+            return ScoreState(runs[mid], valid[len(valid) // 2] if valid else 0)
+        median_runs = int(np.partition(self._history[:, 0], mid)[mid])
+        wickets = self._history[:, 1]
+        valid_wickets = wickets[wickets >= 0]
+        if valid_wickets.size:
+            k = valid_wickets.size // 2
+            median_wickets = int(np.partition(valid_wickets, k)[k])
+        else:
+            median_wickets = 0
         return ScoreState(median_runs, median_wickets)
 
     def _is_plausible(self, score: ScoreState) -> bool:
@@ -328,13 +393,14 @@ class EventDetector:
         return True
 
     def _create_event(self, event_type: str, old: ScoreState, new: ScoreState, timestamp: float) -> Dict:
-        """Create event dictionary."""
+        """Create event dictionary (raw scores; see describe_event for display)."""
         return {
             'type': event_type,
             'timestamp': timestamp,
-            'score_before': str(old),
-            'score_after': str(new),
-            'description': f'Score: {old} → {new}'
+            'runs_before': old.runs,
+            'wickets_before': old.wickets,
+            'runs_after': new.runs,
+            'wickets_after': new.wickets,
         }
 
     def _detect_wicket(self, old: ScoreState, new: ScoreState, timestamp: float) -> Optional[Dict]:
@@ -371,7 +437,7 @@ class EventDetector:
             return self._create_event('FOUR', old, new, timestamp)
         
         # SIX
-        if runs_diff in (5, 6, 7):
+        if runs_diff in self.SIX_RUN_DIFFS:
             return self._create_event('SIX', old, new, timestamp)
         
         return None
@@ -380,9 +446,12 @@ class EventDetector:
         """Get last known wicket count for parse_score heuristic."""
         if self.last_stable_score and self.last_stable_score.wickets >= 0:
             return self.last_stable_score.wickets
-        # Check history for valid wicket
-        valid = [w for w in self.wickets_history if w >= 0]
-        return valid[-1] if valid else None
+        # Walk the ring buffer newest-first for a valid wicket
+        for i in range(1, self._history_len + 1):
+            wickets = int(self._history[(self._history_idx - i) % self.history_size, 1])
+            if wickets >= 0:
+                return wickets
+        return None
 
     def detect(self, score: ScoreState, timestamp: float, overs: Optional[Tuple[int, int]] = None) -> Optional[Dict]:
         """
@@ -396,25 +465,19 @@ class EventDetector:
         if not score or not self._is_plausible(score):
             return None
 
-        # New ball logic: skip if same ball
-        if overs and self.last_over:
-            progressed = (overs[0] > self.last_over[0] or (overs[0] == self.last_over[0] and overs[1] > self.last_over[1]))
-            if not progressed:
-                self.runs_history.append(score.runs)
-                self.wickets_history.append(score.wickets)
-                return None
+        # Every plausible reading feeds the smoothing window
+        self._push_history(score)
 
+        # New ball logic: skip if same ball (overs tuples compare lexicographically)
         if overs:
+            if self.last_over and overs <= self.last_over:
+                return None
             self.last_over = overs
 
-        # Cooldown
+        # Cooldown: skip median and diff work entirely
         if timestamp - self.last_event_time < self.cooldown:
-            self.runs_history.append(score.runs)
-            self.wickets_history.append(score.wickets)
             return None
 
-        self.runs_history.append(score.runs)
-        self.wickets_history.append(score.wickets)
         stable = self._get_median_score()
 
         if not stable:
@@ -471,6 +534,29 @@ class EventDetector:
         self.last_stable_score = stable
         return event
 
+    def detect_batch(self, runs, wickets, timestamps) -> List[Tuple[int, Dict]]:
+        """
+        Feed a recorded stream of readings through detect() in one call.
+
+        Accepts equal-length sequences or numpy arrays (use -1 wickets for
+        runs-only readings) and returns (frame_index, event) pairs.
+        """
+        # tolist() converts arrays to Python ints in one pass instead of per frame
+        if hasattr(runs, 'tolist'):
+            runs = runs.tolist()
+        if hasattr(wickets, 'tolist'):
+            wickets = wickets.tolist()
+        if hasattr(timestamps, 'tolist'):
+            timestamps = timestamps.tolist()
+
+        events = []
+        detect = self.detect
+        for i, (r, w, ts) in enumerate(zip(runs, wickets, timestamps)):
+            event = detect(ScoreState(r, w), ts)
+            if event:
+                events.append((i, event))
+        return events
+
     @staticmethod
     def _format_time(seconds: float) -> str:
         """Format seconds as HH:MM:SS."""
@@ -537,13 +623,24 @@ def visualize_roi(video_path: str, config: ScoreboardConfig, timestamp: float =
     return output_path
 
 
-def process_video(video_path: str, config: ScoreboardConfig, sample_interval: float = 1.0, max_frames: Optional[int] = None, debug_mode: bool = False, min_confidence: float = 0.4) -> List[Dict]:
+def process_video(video_path: str, config: ScoreboardConfig, sample_interval: float = 1.0, max_frames: Optional[int] = None, debug_mode: bool = False, min_confidence: float = 0.4, ocr_reader: Optional["easyocr.Reader"] = None) -> List[Dict]:
     """Process video to detect cricket events."""
+    return list(iter_events(video_path, config, sample_interval, max_frames, debug_mode, min_confidence, ocr_reader))
+
+
+def iter_events(video_path: str, config: ScoreboardConfig, sample_interval: float = 1.0, max_frames: Optional[int] = None, debug_mode: bool = False, min_confidence: float = 0.4, ocr_reader: Optional["easyocr.Reader"] = None) -> Iterator[Dict]:
+    """
+    Scan video and yield cricket events as soon as they are detected.
+
+    Lets callers start work on early events (e.g. clip extraction) while
+    the rest of the video is still being scanned. Pass a preloaded
+    ``ocr_reader`` (see create_easyocr_reader) to skip loading the model.
+    """
     logger.info("=" * 60)
     logger.info("🏏 CRICKET HIGHLIGHT DETECTION")
     logger.info("=" * 60)
 
-    reader = OCRScoreReader(config, use_gpu=config.use_gpu)
+    reader = OCRScoreReader(config, use_gpu=config.use_gpu, reader=ocr_reader)
     detector = EventDetector()
     events = []
 
@@ -613,7 +710,7 @@ def process_video(video_path: str, config: ScoreboardConfig, sample_interval: fl
                     stats['fail'] += 1
                     score = last_valid_score
 
-                logger.debug(f"Frame {processed}: '{text}' conf={conf:.2f} → {score}")
+                logger.debug("Frame %d: '%s' conf=%.2f → %s", processed, text, conf, score)
 
                 # 2-frame confirmation
                 if score:
@@ -623,6 +720,7 @@ def process_video(video_path: str, config: ScoreboardConfig, sample_interval: fl
                             event = detector.detect(score, timestamp, overs)
                             if event:
                                 events.append(event)
+                                yield event
                     else:
                         candidate_score, candidate_count = score, 1
 
@@ -653,8 +751,6 @@ def process_video(video_path: str, config: ScoreboardConfig, sample_interval: fl
     if stats['fail'] > processed * 0.5:
         logger.warning("⚠️ High OCR failure rate. Run with --visualize to check ROI.")
 
-    return events
-
 
 # OUTPUT GENERATION
 
@@ -666,6 +762,16 @@ PADDING_AFTER: float = 10.0
 MERGE_GAP_THRESHOLD: float = 7.0
 
 
+# FFmpeg only reports errors and never reads stdin, so the stderr pipe stays
+# small and many concurrent children don't flood the worker with pipe reads
+FFMPEG_QUIET_ARGS = ('-hide_banner', '-nostdin', '-loglevel', 'error')
+
+
+def _run_ffmpeg(cmd: List[str]) -> subprocess.CompletedProcess:
+    """Run FFmpeg, discarding stdout and capturing only (error-level) stderr."""
+    return subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
 def get_video_duration(video_path: str) -> float:
     """Get video duration in seconds using FFprobe."""
     cmd = [
@@ -681,6 +787,53 @@ def get_video_duration(video_path: str) -> float:
     return float('inf')  # Fallback: no upper bound
 
 
+class ClipRangeCoalescer:
+    """
+    Incrementally merges padded event ranges, in timestamp order.
+
+    A range is closed (and returned by ``add``) as soon as an event arrives
+    that starts beyond ``merge_gap`` of it, so clips can be cut while later
+    events are still being detected.
+    """
+
+    def __init__(
+        self,
+        video_duration: float,
+        padding_before: float = PADDING_BEFORE,
+        padding_after: float = PADDING_AFTER,
+        merge_gap: float = MERGE_GAP_THRESHOLD
+    ):
+        self.video_duration = video_duration
+        self.padding_before = padding_before
+        self.padding_after = padding_after
+        self.merge_gap = merge_gap
+        self._current: Optional[Dict] = None
+
+    def add(self, event: Dict) -> Optional[Dict]:
+        """Add an event; return the previous range if this event closes it."""
+        ts = event['timestamp']
+        start = max(0.0, ts - self.padding_before)
+        end = min(self.video_duration, ts + self.padding_after)
+        
+        last = self._current
+        if last is not None and start <= last['end'] + self.merge_gap:
+            # Extend the open range to include this event
+            last['end'] = max(last['end'], end)
+            last['events'].append(event)
+            logger.debug("Merged clips: %.1fs - %.1fs (%d events)",
+                         last['start'], last['end'], len(last['events']))
+            return None
+        
+        # Gap too large (or first event) - start a new range
+        self._current = {'start': start, 'end': end, 'events': [event]}
+        return last
+
+    def flush(self) -> Optional[Dict]:
+        """Close and return the open range, if any."""
+        last, self._current = self._current, None
+        return last
+
+
 def calculate_clip_ranges(
     events: List[Dict],
     video_duration: float,
@@ -707,38 +860,15 @@ def calculate_clip_ranges(
     if not events:
         return []
     
-    # Step 1: Create raw time ranges with padding (bounds-checked)
-    raw_ranges = []
-    for event in events:
-        ts = event['timestamp']
-        start = max(0.0, ts - padding_before)
-        end = min(video_duration, ts + padding_after)
-        raw_ranges.append({
-            'start': start,
-            'end': end,
-            'events': [event]
-        })
-    
-    # Step 2: Sort by start time
-    raw_ranges.sort(key=lambda r: r['start'])
-    
-    # Step 3: Smart merge - coalesce overlapping/nearby clips
-    merged = [raw_ranges[0]]
-    
-    for current in raw_ranges[1:]:
-        last = merged[-1]
-        
-        # Merge condition: current starts within (last.end + merge_gap)
-        # This handles both overlapping clips and clips that are close together
-        if current['start'] <= last['end'] + merge_gap:
-            # Extend the last range to include current
-            last['end'] = max(last['end'], current['end'])
-            last['events'].extend(current['events'])
-            logger.debug(f"Merged clips: {last['start']:.1f}s - {last['end']:.1f}s "
-                        f"({len(last['events'])} events)")
-        else:
-            # Gap too large - start a new clip
-            merged.append(current)
+    # Ranges share the same padding, so sorting events by timestamp
+    # also sorts the padded ranges by start time
+    coalescer = ClipRangeCoalescer(video_duration, padding_before, padding_after, merge_gap)
+    merged = []
+    for event in sorted(events, key=lambda e: e['timestamp']):
+        closed = coalescer.add(event)
+        if closed:
+            merged.append(closed)
+    merged.append(coalescer.flush())
     
     logger.info(f"📊 Clip coalescing: {len(events)} events → {len(merged)} clips")
     for i, clip in enumerate(merged, 1):
@@ -777,7 +907,6 @@ def extract_clips(
         List of paths to extracted clip files
     """
     Path(output_dir).mkdir(parents=True, exist_ok=True)
-    video_id = Path(video_path).stem
     clips = []
     
     if not events:
@@ -797,40 +926,61 @@ def extract_clips(
                f"(padding: {before}s before, {after}s after, merge gap: {merge_gap}s)")
     
     for i, clip_range in enumerate(clip_ranges, 1):
-        start = clip_range['start']
-        end = clip_range['end']
-        duration = end - start
-        event_count = len(clip_range['events'])
-        
-        # Generate descriptive filename
-        event_types = '_'.join(sorted(set(e['type'] for e in clip_range['events'])))
-        clip_name = f"{video_id}_clip_{i:03d}_{event_types}_{int(start)}-{int(end)}.mp4"
-        clip_path = Path(output_dir) / clip_name
-        
-        cmd = [
-            'ffmpeg',
-            '-ss', str(start),
-            '-i', video_path,
-            '-t', str(duration),
-            '-c', 'copy',
-            '-avoid_negative_ts', '1',
-            '-y',
-            str(clip_path)
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True)
-        if result.returncode == 0:
-            clips.append(str(clip_path))
-            size = clip_path.stat().st_size / (1024 * 1024)
-            logger.info(f"  [{i}/{len(clip_ranges)}] {clip_name} "
-                       f"({duration:.1f}s, {event_count} events, {size:.1f} MB)")
-        else:
-            logger.error(f"  [{i}/{len(clip_ranges)}] Failed: {clip_name}")
-            logger.debug(f"FFmpeg stderr: {result.stderr.decode()}")
+        clip_path = extract_clip(video_path, clip_range, output_dir, i)
+        if clip_path:
+            clips.append(clip_path)
     
     return clips
 
 
+def extract_clip(video_path: str, clip_range: Dict, output_dir: str, index: int) -> Optional[str]:
+    """
+    Cut a single merged clip range out of the source video (stream copy).
+    
+    Args:
+        video_path: Path to source video
+        clip_range: Range from calculate_clip_ranges / ClipRangeCoalescer
+        output_dir: Directory for the output clip
+        index: 1-based clip number used in the filename
+    
+    Returns:
+        Path to the extracted clip, or None if FFmpeg failed
+    """
+    video_id = Path(video_path).stem
+    start = clip_range['start']
+    end = clip_range['end']
+    duration = end - start
+    event_count = len(clip_range['events'])
+    
+    # Generate descriptive filename
+    event_types = '_'.join(sorted(set(e['type'] for e in clip_range['events'])))
+    clip_name = f"{video_id}_clip_{index:03d}_{event_types}_{int(start)}-{int(end)}.mp4"
+    clip_path = Path(output_dir) / clip_name
+    
+    cmd = [
+        'ffmpeg', *FFMPEG_QUIET_ARGS,
+        '-ss', str(start),
+        '-i', video_path,
+        '-t', str(duration),
+        '-c', 'copy',
+        '-avoid_negative_ts', 'make_zero',
+        '-y',
+        str(clip_path)
+    ]
+    
+    result = _run_ffmpeg(cmd)
+    if result.returncode != 0:
+        logger.error(f"  [{index}] Failed: {clip_name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("FFmpeg stderr: %s", result.stderr.decode(errors='replace'))
+        return None
+    
+    size = clip_path.stat().st_size / (1024 * 1024)
+    logger.info(f"  [{index}] {clip_name} "
+               f"({duration:.1f}s, {event_count} events, {size:.1f} MB)")
+    return str(clip_path)
+
+
 def create_supercut(clips: List[str], output_path: str) -> Optional[str]:
     """Concatenate clips into highlight reel."""
     if not clips:
@@ -841,9 +991,9 @@ def create_supercut(clips: List[str], output_path: str) -> Optional[str]:
         for clip in clips:
             f.write(f"file '{Path(clip).absolute()}'\n")
 
-    cmd = ['ffmpeg', '-f', 'concat', '-safe', '0', '-i', str(concat_file),
+    cmd = ['ffmpeg', *FFMPEG_QUIET_ARGS, '-f', 'concat', '-safe', '0', '-i', str(concat_file),
            '-c', 'copy', '-y', str(output_path)]
-    result = subprocess.run(cmd, capture_output=True)
+    result = _run_ffmpeg(cmd)
     concat_file.unlink()
 
     if result.returncode == 0:
@@ -862,7 +1012,7 @@ def save_events_csv(events: List[Dict], output_path: str):
         writer = csv.writer(f)
         writer.writerow(['timestamp', 'type', 'description'])
         for event in events:
-            writer.writerow([event['timestamp'], event['type'], event['description']])
+            writer.writerow([event['timestamp'], event['type'], describe_event(event)])
     logger.info(f"📄 Events saved: {output_path}")
 
 
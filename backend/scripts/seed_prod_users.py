@@ -22,19 +22,16 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy import text
-from passlib.context import CryptContext
 from database.config import SessionLocal
+from database.models.user import pwd_context
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Password hashing (same config as the app)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
+    """Hash password (argon2id)."""
     return pwd_context.hash(password)
 
 
@@ -5,12 +5,14 @@ Integrates with the existing ocr_engine.py to process videos asynchronously.
 """
 
 import logging
-import traceback
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, TypeVar
 
-from sqlalchemy import text
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from database.config import get_background_db, BackgroundSessionLocal
@@ -18,6 +20,156 @@ from database.models.video import Video, HighlightJob, HighlightEvent, VideoStat
 
 logger = logging.getLogger(__name__)
 
+# Dedicated worker pools, sized per stage: OCR is GPU/CPU heavy and runs one
+# job at a time by default, while FFmpeg clip cuts are I/O bound and shared
+# across jobs. Keeping them off the request threadpool means a long OCR job
+# can't starve the sync route handlers and lightweight background tasks.
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "1"))
+FFMPEG_WORKERS = int(os.getenv("FFMPEG_WORKERS", "4"))
+
+_ocr_executor = ThreadPoolExecutor(max_workers=OCR_WORKERS, thread_name_prefix="ocr")
+_ffmpeg_executor = ThreadPoolExecutor(max_workers=FFMPEG_WORKERS, thread_name_prefix="ffmpeg")
+
+# Upper bound for the exponential retry backoff
+RETRY_MAX_DELAY_SECONDS = 300
+
+
+def retry_backoff_seconds(retry_count: int) -> int:
+    """Delay before re-running a failed job: 2**retry_count, capped at 5 minutes."""
+    return min(2 ** retry_count, RETRY_MAX_DELAY_SECONDS)
+
+# EasyOCR models cached per OCR worker thread, keyed by use_gpu. Loading the
+# model takes seconds and hundreds of MB, so it is done once per worker
+# rather than once per job; per-job ROI overrides live in ScoreboardConfig.
+_worker_state = threading.local()
+
+T = TypeVar("T")
+
+
+def _get_ocr_reader(use_gpu: bool):
+    """Return this worker's cached EasyOCR reader, loading it on first use."""
+    readers = getattr(_worker_state, "readers", None)
+    if readers is None:
+        readers = _worker_state.readers = {}
+    if use_gpu not in readers:
+        from scripts.ocr_engine import create_easyocr_reader
+        readers[use_gpu] = create_easyocr_reader(use_gpu)
+    return readers[use_gpu]
+
+
+def _commit_phase(apply: Callable[[Session], T]) -> T:
+    """
+    Apply a phase update in a short-lived background session and commit it.
+    
+    Relies on the engine's pool_pre_ping to detect and replace connections
+    that died during a long OCR phase when the session checks one out.
+    """
+    with BackgroundSessionLocal() as db:
+        result = apply(db)
+        db.commit()
+        return result
+
+
+def _update_progress(db: Session, video_id: str, percent: int) -> None:
+    """Set the job progress percentage (single UPDATE, no ORM load)."""
+    db.execute(
+        update(HighlightJob)
+        .where(HighlightJob.video_id == video_id)
+        .values(progress_percent=percent)
+    )
+
+
+def _save_results(
+    db: Session,
+    video_id: str,
+    events: List[Dict],
+    clips: List[str],
+    supercut_path: Optional[str],
+) -> Dict[str, int]:
+    """Persist detected events and mark the video and job as completed."""
+    from scripts.ocr_engine import describe_event, format_score
+    
+    fours = sixes = wickets = 0
+    # HighlightJob.events_detected is served as-is by GET /jobs/{id}/result,
+    # so it keeps the formatted score_before/score_after/description shape
+    events_detected = []
+    for i, event in enumerate(events):
+        score_before = format_score(event['runs_before'], event['wickets_before'])
+        score_after = format_score(event['runs_after'], event['wickets_after'])
+        events_detected.append({
+            'type': event['type'],
+            'timestamp': event['timestamp'],
+            'score_before': score_before,
+            'score_after': score_after,
+            'description': describe_event(event),
+        })
+        highlight_event = HighlightEvent(
+            video_id=video_id,
+            event_type=event['type'],
+            timestamp_seconds=event['timestamp'],
+            score_before=score_before,
+            score_after=score_after,
+            clip_path=clips[i] if i < len(clips) else None,
+        )
+        db.add(highlight_event)
+        
+        # Count by type
+        if event['type'] == 'FOUR':
+            fours += 1
+        elif event['type'] == 'SIX':
+            sixes += 1
+        elif event['type'] == 'WICKET':
+            wickets += 1
+    
+    completed_at = datetime.utcnow()
+    
+    # Update video statistics
+    db.execute(
+        update(Video)
+        .where(Video.id == video_id)
+        .values(
+            status=VideoStatus.COMPLETED.value,
+            processing_completed_at=completed_at,
+            total_events=len(events),
+            total_fours=fours,
+            total_sixes=sixes,
+            total_wickets=wickets,
+        )
+    )
+    
+    # Update job with results
+    db.execute(
+        update(HighlightJob)
+        .where(HighlightJob.video_id == video_id)
+        .values(
+            status=VideoStatus.COMPLETED.value,
+            progress_percent=100,
+            completed_at=completed_at,
+            events_detected=events_detected,
+            supercut_path=supercut_path,
+        )
+    )
+    
+    return {'fours': fours, 'sixes': sixes, 'wickets': wickets}
+
+
+def _mark_failed(db: Session, video_id: str, error_message: str) -> None:
+    """Mark the video and job as failed and count the attempt."""
+    db.execute(
+        update(Video)
+        .where(Video.id == video_id)
+        .values(status=VideoStatus.FAILED.value, processing_error=error_message)
+    )
+    db.execute(
+        update(HighlightJob)
+        .where(HighlightJob.video_id == video_id)
+        .values(
+            status=VideoStatus.FAILED.value,
+            error_message=error_message,
+            retry_count=HighlightJob.retry_count + 1,
+        )
+    )
+
 
 def run_ocr_processing(video_id: str, config: Optional[Dict] = None) -> None:
     """
@@ -30,40 +182,43 @@ def run_ocr_processing(video_id: str, config: Optional[Dict] = None) -> None:
         video_id: UUID of the video to process
         config: Optional OCR configuration overrides (ROI settings, etc.)
     """
-    # Use background session to avoid polluting the main connection pool
-    db: Session = get_background_db()
-    
     try:
-        # Fetch video and job
-        video = db.query(Video).filter(Video.id == video_id).first()
-        if not video:
-            logger.error(f"Video {video_id} not found")
-            return
-        
-        job = db.query(HighlightJob).filter(HighlightJob.video_id == video_id).first()
-        if not job:
-            logger.error(f"HighlightJob for video {video_id} not found")
-            return
-        
-        # Update status to processing
-        video.status = VideoStatus.PROCESSING.value
-        video.processing_started_at = datetime.utcnow()
-        job.status = VideoStatus.PROCESSING.value
-        job.started_at = datetime.utcnow()
-        job.config = config
-        
-        # Commit and refresh connection
-        db.commit()
-        db.refresh(video)
-        db.refresh(job)
+        # Use background session to avoid polluting the main connection pool.
+        # It is closed before OCR starts so no connection is held for hours.
+        with get_background_db() as db:
+            # Fetch video and job
+            video = db.query(Video).filter(Video.id == video_id).first()
+            if not video:
+                logger.error(f"Video {video_id} not found")
+                return
+            
+            job = db.query(HighlightJob).filter(HighlightJob.video_id == video_id).first()
+            if not job:
+                logger.error(f"HighlightJob for video {video_id} not found")
+                return
+            
+            # Update status to processing
+            video.status = VideoStatus.PROCESSING.value
+            video.processing_started_at = datetime.utcnow()
+            job.status = VideoStatus.PROCESSING.value
+            job.started_at = datetime.utcnow()
+            job.config = config
+            
+            # Read what the later phases need before commit expires the row
+            video_title = video.title
+            video_path = video.file_path
+            
+            db.commit()
         
-        logger.info(f"Starting OCR processing for video: {video.title} ({video_id})")
+        logger.info(f"Starting OCR processing for video: {video_title} ({video_id})")
         
         # Import OCR engine (lazy import to avoid circular dependencies)
         from scripts.ocr_engine import (
             ScoreboardConfig,
-            process_video,
-            extract_clips,
+            ClipRangeCoalescer,
+            iter_events,
+            extract_clip,
+            get_video_duration,
             create_supercut,
         )
         
@@ -85,35 +240,7 @@ def run_ocr_processing(video_id: str, config: Optional[Dict] = None) -> None:
             if 'start_time' in config:
                 ocr_config.start_time = config['start_time']
         
-        # Run OCR detection
-        video_path = video.file_path
-        events = process_video(
-            video_path=video_path,
-            config=ocr_config,
-            sample_interval=1.0,
-            min_confidence=0.4,
-        )
-        
-        logger.info(f"Detected {len(events)} events for video {video_id}")
-        
-        # Update job progress
-        job.progress_percent = 50
-        
-        # Validate connection before commit (long OCR task may have timed out)
-        try:
-            db.execute(text("SELECT 1"))
-        except Exception:
-            logger.warning("Database connection lost, creating new session")
-            db.rollback()
-            db.close()
-            db = BackgroundSessionLocal()
-            job = db.query(HighlightJob).filter(HighlightJob.video_id == video_id).first()
-            job.progress_percent = 50
-        
-        db.commit()
-        db.refresh(job)
-        
-        # Extract clips with configurable padding
+        # Clips are cut under the job-specific clips directory
         clips_dir = Path("storage/trimmed") / video_id
         clips_dir.mkdir(parents=True, exist_ok=True)
         
@@ -123,31 +250,40 @@ def run_ocr_processing(video_id: str, config: Optional[Dict] = None) -> None:
         
         logger.info(f"Extracting clips with padding: before={clip_before}s, after={clip_after}s")
         
-        clips = []
-        if events:
-            clips = extract_clips(
-                video_path=video_path,
-                events=events,
-                output_dir=str(clips_dir),
-                before=clip_before,
-                after=clip_after,
-            )
+        # Run OCR detection, cutting each merged clip range as soon as a later
+        # event closes it so FFmpeg overlaps with the remaining OCR scan
+        coalescer = ClipRangeCoalescer(get_video_duration(video_path), clip_before, clip_after)
+        events = []
+        clip_futures = []
         
-        job.progress_percent = 80
+        def submit_clip(clip_range: Dict) -> None:
+            clip_futures.append(_ffmpeg_executor.submit(
+                extract_clip, video_path, clip_range, str(clips_dir), len(clip_futures) + 1
+            ))
         
-        # Validate connection before commit
-        try:
-            db.execute(text("SELECT 1"))
-        except Exception:
-            logger.warning("Database connection lost, creating new session")
-            db.rollback()
-            db.close()
-            db = BackgroundSessionLocal()
-            job = db.query(HighlightJob).filter(HighlightJob.video_id == video_id).first()
-            job.progress_percent = 80
+        for event in iter_events(
+            video_path=video_path,
+            config=ocr_config,
+            sample_interval=1.0,
+            min_confidence=0.4,
+            ocr_reader=_get_ocr_reader(ocr_config.use_gpu),
+        ):
+            events.append(event)
+            closed_range = coalescer.add(event)
+            if closed_range:
+                submit_clip(closed_range)
         
-        db.commit()
-        db.refresh(job)
+        last_range = coalescer.flush()
+        if last_range:
+            submit_clip(last_range)
+        
+        logger.info(f"Detected {len(events)} events for video {video_id}")
+        _commit_phase(lambda db: _update_progress(db, video_id, 50))
+        
+        # Wait for the remaining clip cuts
+        clips = [path for path in (f.result() for f in clip_futures) if path]
+        
+        _commit_phase(lambda db: _update_progress(db, video_id, 80))
         
         # Create supercut
         supercut_path = None
@@ -157,112 +293,42 @@ def run_ocr_processing(video_id: str, config: Optional[Dict] = None) -> None:
             supercut_file = supercut_dir / f"{video_id}_highlights.mp4"
             supercut_path = create_supercut(clips, str(supercut_file))
         
-        # Save events to database
-        fours = sixes = wickets = 0
-        for i, event in enumerate(events):
-            highlight_event = HighlightEvent(
-                video_id=video_id,
-                event_type=event['type'],
-                timestamp_seconds=event['timestamp'],
-                score_before=event.get('score_before'),
-                score_after=event.get('score_after'),
-                clip_path=clips[i] if i < len(clips) else None,
-            )
-            db.add(highlight_event)
-            
-            # Count by type
-            if event['type'] == 'FOUR':
-                fours += 1
-            elif event['type'] == 'SIX':
-                sixes += 1
-            elif event['type'] == 'WICKET':
-                wickets += 1
-        
-        # Update video statistics
-        video.status = VideoStatus.COMPLETED.value
-        video.processing_completed_at = datetime.utcnow()
-        video.total_events = len(events)
-        video.total_fours = fours
-        video.total_sixes = sixes
-        video.total_wickets = wickets
-        
-        # Update job with results
-        job.status = VideoStatus.COMPLETED.value
-        job.progress_percent = 100
-        job.completed_at = datetime.utcnow()
-        job.events_detected = events
-        job.supercut_path = supercut_path
-        
-        # Validate connection before final commit
-        try:
-            db.execute(text("SELECT 1"))
-        except Exception:
-            logger.warning("Database connection lost, creating new session")
-            db.rollback()
-            db.close()
-            db = BackgroundSessionLocal()
-            video = db.query(Video).filter(Video.id == video_id).first()
-            job = db.query(HighlightJob).filter(HighlightJob.video_id == video_id).first()
-            
-            # Re-apply final updates
-            video.status = VideoStatus.COMPLETED.value
-            video.processing_completed_at = datetime.utcnow()
-            video.total_events = len(events)
-            video.total_fours = fours
-            video.total_sixes = sixes
-            video.total_wickets = wickets
-            
-            job.status = VideoStatus.COMPLETED.value
-            job.progress_percent = 100
-            job.completed_at = datetime.utcnow()
-            job.events_detected = events
-            job.supercut_path = supercut_path
-        
-        db.commit()
+        # Save events and final statistics to database
+        counts = _commit_phase(
+            lambda db: _save_results(db, video_id, events, clips, supercut_path)
+        )
         
         logger.info(f"✅ Completed OCR processing for video {video_id}: "
-                    f"{fours} fours, {sixes} sixes, {wickets} wickets")
+                    f"{counts['fours']} fours, {counts['sixes']} sixes, {counts['wickets']} wickets")
         
     except Exception as e:
-        logger.error(f"❌ OCR processing failed for video {video_id}: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("❌ OCR processing failed for video %s", video_id)
         
-        # Rollback any pending transaction
+        # Update status to failed in a fresh session
+        error_message = str(e)[:500]  # Truncate to avoid huge errors
         try:
-            db.rollback()
-        except Exception:
-            pass
-        
-        # Update status to failed with new session if needed
-        try:
-            # Test if session is still valid
-            try:
-                db.execute(text("SELECT 1"))
-            except Exception:
-                # Session is dead, create new one
-                logger.warning("Database session invalid, creating new session for error update")
-                db.close()
-                db = BackgroundSessionLocal()
-            
-            video = db.query(Video).filter(Video.id == video_id).first()
-            job = db.query(HighlightJob).filter(HighlightJob.video_id == video_id).first()
-            
-            if video:
-                video.status = VideoStatus.FAILED.value
-                video.processing_error = str(e)[:500]  # Truncate to avoid huge errors
-            
-            if job:
-                job.status = VideoStatus.FAILED.value
-                job.error_message = str(e)[:500]
-                job.retry_count += 1
-            
-            db.commit()
+            _commit_phase(lambda db: _mark_failed(db, video_id, error_message))
         except Exception as db_error:
             logger.error(f"Failed to update error status: {db_error}")
-            db.rollback()
+
+
+def enqueue_ocr_processing(video_id: str, config: Optional[Dict] = None, delay: float = 0.0) -> None:
+    """
+    Queue a video for OCR processing on the dedicated OCR worker pool.
     
-    finally:
-        db.close()
+    Returns immediately; the job's progress is tracked in HighlightJob.
+    
+    Args:
+        video_id: UUID of the video to process
+        config: Optional OCR configuration overrides (ROI settings, etc.)
+        delay: Seconds to wait before queueing (used for retry backoff)
+    """
+    if delay > 0:
+        timer = threading.Timer(delay, _ocr_executor.submit, args=(run_ocr_processing, video_id, config))
+        timer.daemon = True
+        timer.start()
+    else:
+        _ocr_executor.submit(run_ocr_processing, video_id, config)
 
 
 def get_job_status(video_id: str) -> Optional[Dict]:
@@ -283,47 +349,3 @@ def get_job_status(video_id: str) -> Optional[Dict]:
         return None
     finally:
         db.close()
-
-
-def retry_failed_job(video_id: str, config: Optional[Dict] = None) -> bool:
-    """
-    Retry a failed processing job.
-    
-    Args:
-        video_id: UUID of the video to retry
-        config: Optional new configuration
-        
-    Returns:
-        True if retry was initiated, False otherwise
-    """
-    db = BackgroundSessionLocal()
-    try:
-        job = db.query(HighlightJob).filter(HighlightJob.video_id == video_id).first()
-        
-        if not job:
-            logger.error(f"No job found for video {video_id}")
-            return False
-        
-        if job.status != VideoStatus.FAILED.value:
-            logger.warning(f"Job for video {video_id} is not in FAILED state")
-            return False
-        
-        if job.retry_count >= 3:
-            logger.error(f"Max retries exceeded for video {video_id}")
-            return False
-        
-        # Reset job status
-        job.status = VideoStatus.PENDING.value
-        job.progress_percent = 0
-        job.error_message = None
-        db.commit()
-        
-        logger.info(f"Retrying job for video {video_id} (attempt {job.retry_count + 1})")
-        
-        # Trigger processing (would be called via BackgroundTasks in real implementation)
-        run_ocr_processing(video_id, config)
-        
-        return True
-        
-    finally:
-        db.close()
@@ -8,11 +8,18 @@ import sys
 import logging
 from pathlib import Path
 
+import numpy as np
+
 # Add scripts directory to path to import ocr_engine
 scripts_dir = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(scripts_dir))
 
-from scripts.ocr_engine import EventDetector, ScoreState
+from scripts.ocr_engine import (
+    ClipRangeCoalescer,
+    EventDetector,
+    ScoreState,
+    calculate_clip_ranges,
+)
 
 # Configure logging to show output during tests
 logging.basicConfig(level=logging.INFO)
@@ -191,5 +198,94 @@ class TestEventDetector(unittest.TestCase):
             self.assertEqual(found_event["type"], "FOUR")
 
 
+class TestDetectBatch(unittest.TestCase):
+    def test_matches_per_frame_detect(self):
+        """detect_batch should report the same events as feeding detect() frame by frame"""
+        runs = np.array([10] * 5 + [14] * 5 + [20] * 20 + [20] * 5, dtype=np.int32)
+        wickets = np.array([0] * 30 + [1] * 5, dtype=np.int32)
+        timestamps = np.arange(runs.size, dtype=np.float64) * 5.0
+
+        expected = []
+        single = EventDetector()
+        for i in range(runs.size):
+            event = single.detect(ScoreState(int(runs[i]), int(wickets[i])), float(timestamps[i]))
+            if event:
+                expected.append((i, event))
+
+        batched = EventDetector().detect_batch(runs, wickets, timestamps)
+
+        self.assertEqual(batched, expected)
+        self.assertEqual([e["type"] for _, e in batched], ["FOUR", "SIX", "WICKET"])
+
+    def test_new_innings_stream(self):
+        """A sustained 0/0 stream after a high score resets without events"""
+        detector = EventDetector()
+        runs = np.concatenate([np.full(5, 200), np.full(70, 0)])
+        wickets = np.concatenate([np.full(5, 5), np.full(70, 0)])
+        timestamps = np.arange(runs.size, dtype=np.float64)
+
+        self.assertEqual(detector.detect_batch(runs, wickets, timestamps), [])
+        self.assertEqual(detector.last_stable_score, ScoreState(0, 0))
+
+
+class TestClipRanges(unittest.TestCase):
+    """Padding/merge behaviour of calculate_clip_ranges and ClipRangeCoalescer."""
+
+    PARAMS = dict(padding_before=5.0, padding_after=5.0, merge_gap=2.0)
+    DURATION = 100.0
+
+    @staticmethod
+    def _events(*timestamps):
+        return [{'type': 'FOUR', 'timestamp': ts} for ts in timestamps]
+
+    def _spans(self, ranges):
+        return [(r['start'], r['end'], [e['timestamp'] for e in r['events']]) for r in ranges]
+
+    def _ranges(self, *timestamps):
+        return self._spans(calculate_clip_ranges(self._events(*timestamps), self.DURATION, **self.PARAMS))
+
+    def test_overlapping_events_merge(self):
+        self.assertEqual(self._ranges(20.0, 25.0), [(15.0, 30.0, [20.0, 25.0])])
+
+    def test_gap_within_merge_gap_merges(self):
+        # 15-25 and 26-36: 1s gap <= merge_gap
+        self.assertEqual(self._ranges(20.0, 31.0), [(15.0, 36.0, [20.0, 31.0])])
+
+    def test_gap_just_above_merge_gap_splits(self):
+        # 15-25 and 27.5-37.5: 2.5s gap > merge_gap
+        self.assertEqual(
+            self._ranges(20.0, 32.5),
+            [(15.0, 25.0, [20.0]), (27.5, 37.5, [32.5])],
+        )
+
+    def test_clamped_to_video_bounds(self):
+        self.assertEqual(
+            self._ranges(2.0, 98.0),
+            [(0.0, 7.0, [2.0]), (93.0, 100.0, [98.0])],
+        )
+
+    def test_unsorted_input(self):
+        self.assertEqual(
+            self._ranges(50.0, 10.0, 52.0),
+            [(5.0, 15.0, [10.0]), (45.0, 57.0, [50.0, 52.0])],
+        )
+
+    def test_empty_input(self):
+        self.assertEqual(calculate_clip_ranges([], self.DURATION, **self.PARAMS), [])
+
+    def test_incremental_matches_batch(self):
+        timestamps = (2.0, 5.0, 20.0, 31.0, 45.0, 47.5, 70.0, 98.0)
+        coalescer = ClipRangeCoalescer(self.DURATION, **self.PARAMS)
+        incremental = []
+        for event in self._events(*timestamps):
+            closed = coalescer.add(event)
+            if closed:
+                incremental.append(closed)
+        incremental.append(coalescer.flush())
+        self.assertIsNone(coalescer.flush())
+
+        self.assertEqual(self._spans(incremental), self._ranges(*timestamps))
+
+
 if __name__ == "__main__":
     unittest.main()
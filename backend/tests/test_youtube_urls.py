@@ -0,0 +1,64 @@
+"""
+Unit tests for YouTube URL parsing used by the upload route.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add backend root to path so utils.youtube imports from any cwd
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from utils.youtube import (
+    extract_video_id_from_url,
+    parse_youtube_url,
+    validate_youtube_url,
+)
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+# (url, expected id or None)
+CASES = [
+    # Accepted
+    (f"https://youtu.be/{VIDEO_ID}", VIDEO_ID),
+    (f"https://youtu.be/{VIDEO_ID}?si=AbCdEf123", VIDEO_ID),
+    (f"https://www.youtube.com/watch?v={VIDEO_ID}", VIDEO_ID),
+    (f"https://www.youtube.com/watch?v={VIDEO_ID}&t=120s", VIDEO_ID),
+    (f"https://www.youtube.com/embed/{VIDEO_ID}", VIDEO_ID),
+    (f"https://www.youtube.com/v/{VIDEO_ID}", VIDEO_ID),
+    (f"https://www.youtube.com/shorts/{VIDEO_ID}", VIDEO_ID),
+    (f"https://www.youtube.com/live/{VIDEO_ID}", VIDEO_ID),
+    (f"https://www.youtube.com/live/{VIDEO_ID}?si=AbCdEf123", VIDEO_ID),
+    (f"https://www.youtube-nocookie.com/embed/{VIDEO_ID}", VIDEO_ID),
+    (f"http://youtube.com/watch?v={VIDEO_ID}", VIDEO_ID),
+    (f"youtube.com/watch?v={VIDEO_ID}", VIDEO_ID),
+    (f"youtu.be/{VIDEO_ID}", VIDEO_ID),
+    # Rejected
+    (f"https://m.youtube.com/watch?v={VIDEO_ID}", None),
+    (f"https://www.youtube.com/watch?feature=share&v={VIDEO_ID}", None),
+    ("https://youtu.be/dQw4w9WgXc", None),  # 10-character ID
+    ("https://www.youtube.com/watch?v=dQw4w9WgXc", None),
+    (f"https://evil.com/youtu.be/{VIDEO_ID}", None),
+    (f"https://vimeo.com/live/{VIDEO_ID}", None),
+    ("https://www.youtube.com/watch?v=dQw4w9W$XcQ", None),  # outside ID alphabet
+    ("", None),
+]
+
+
+class TestParseYoutubeUrl(unittest.TestCase):
+    def test_parse(self):
+        for url, expected in CASES:
+            with self.subTest(url=url):
+                self.assertEqual(parse_youtube_url(url), expected)
+
+    def test_wrappers_agree_with_parse(self):
+        """validate/extract are thin wrappers and must give the same answer"""
+        for url, expected in CASES:
+            with self.subTest(url=url):
+                self.assertEqual(validate_youtube_url(url), expected is not None)
+                self.assertEqual(extract_video_id_from_url(url), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
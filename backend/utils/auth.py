@@ -2,34 +2,68 @@
 JWT Token utilities for authentication
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import timedelta
+from typing import Any, Optional
 import jwt
-from passlib.context import CryptContext
+import orjson
 from fastapi import HTTPException, Security, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from database.models.user import User
+from database.models.user import User, pwd_context
 from database.models.session import UserSession
 from database.config import get_db
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from cachetools import TTLCache
 import secrets
+import threading
+import time
 import os
 
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY") or os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRATION_MINUTES", "1800"))  
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_DEFAULT_SECONDS = 7 * 24 * 60 * 60
 REFRESH_TOKEN_EXPIRE_DAYS = 30
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT with orjson for the claims (de)serialization step."""
+
+    def _encode_payload(self, payload: dict[str, Any], headers=None, json_encoder=None) -> bytes:
+        if json_encoder is not None:
+            return super()._encode_payload(payload, headers, json_encoder)
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> dict[str, Any]:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+# Decoded access-token payloads keyed by raw token, so repeated requests with
+# the same bearer token skip the HMAC check and JSON parse.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+_EXPIRED = object()
+
+# Detached User snapshots keyed by email, so authenticated requests skip the
+# users lookup. Call invalidate_user_cache() after changing a user's row.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=20)
+_user_cache_lock = threading.Lock()
 
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
+    """Hash a password (argon2id)."""
     return pwd_context.hash(password)
 
 
@@ -41,43 +75,95 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
+    # PyJWT takes numeric POSIX timestamps; one clock read covers exp and iat
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + ACCESS_TOKEN_EXPIRE_SECONDS
 
-    to_encode.update({"exp": expire, "iat": datetime.utcnow(), "type": "access"})
+    to_encode.update({"exp": expire, "iat": now, "type": "access"})
 
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def create_refresh_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Creates a refresh token"""
     to_encode = data.copy()
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(days=7)
+        expire = now + REFRESH_TOKEN_DEFAULT_SECONDS
     
     to_encode.update({"exp": expire, "type": "refresh"})
     
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def verify_access_token(token: str) -> dict:
     """Verify JWT access token and return payload"""
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+    if cached is _EXPIRED:
+        raise HTTPException(status_code=401, detail="Token has expired")
+    if cached is not None:
+        # The cache TTL can outlive the token itself; honour exp on hits too
+        if cached.get("exp", float("inf")) > time.time():
+            return cached
+        with _token_cache_lock:
+            _token_cache[token] = _EXPIRED
+        raise HTTPException(status_code=401, detail="Token has expired")
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        if payload.get("type") != "access":
-            raise HTTPException(status_code=401, detail="Invalid token type")
-        return payload
+        payload = _jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError:
+        with _token_cache_lock:
+            _token_cache[token] = _EXPIRED
         raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
 
+    if payload.get("type") != "access":
+        raise HTTPException(status_code=401, detail="Invalid token type")
+
+    with _token_cache_lock:
+        _token_cache[token] = payload
+    return payload
+
+
+def invalidate_user_cache(email: str) -> None:
+    """Drop the cached snapshot for a user whose row has changed."""
+    with _user_cache_lock:
+        _user_cache.pop(email, None)
+
+
+def _cache_user(user: User) -> None:
+    """Store a detached column-only copy of user in the cache."""
+    snapshot = User(**{
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+    })
+    make_transient_to_detached(snapshot)
+    with _user_cache_lock:
+        _user_cache[user.email] = snapshot
+
+
+def _load_user(db: Session, email: str) -> Optional[User]:
+    """Return the user for email attached to db, from the cache when possible."""
+    with _user_cache_lock:
+        snapshot = _user_cache.get(email)
+    if snapshot is not None:
+        # load=False attaches a copy to this session without a SELECT
+        return db.merge(snapshot, load=False)
+
+    user = db.query(User).filter(User.email == email).first()
+    if user is not None:
+        _cache_user(user)
+    return user
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Security(security),
@@ -97,7 +183,7 @@ def get_current_user(
     
     for attempt in range(max_retries):
         try:
-            user = db.query(User).filter(User.email == email).first()
+            user = _load_user(db, email)
             if user is None:
                 raise HTTPException(status_code=401, detail="User not found")
             return user
@@ -106,7 +192,6 @@ def get_current_user(
         except Exception as e:
             last_error = e
             if attempt < max_retries - 1:
-                import time
                 time.sleep(0.5 * (attempt + 1))
                 # Try to rollback and get fresh connection
                 try:
@@ -141,8 +226,7 @@ def get_optional_user(
         if email is None:
             return None
         
-        user = db.query(User).filter(User.email == email).first()
-        return user
+        return _load_user(db, email)
     except Exception:
         # Any error in auth means no user
         return None
@@ -3,6 +3,7 @@ Application configuration management.
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List
 from pydantic_settings import BaseSettings
@@ -43,14 +44,14 @@ class Settings(BaseSettings):
         case_sensitive = True
         extra = "ignore"
 
-    @property
+    @cached_property
     def allowed_origins_list(self) -> List[str]:
-        """Parse ALLOWED_ORIGINS as a list."""
+        """Parse ALLOWED_ORIGINS as a list (once per instance)."""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
 
-    @property
+    @cached_property
     def supported_formats_list(self) -> List[str]:
-        """Parse SUPPORTED_VIDEO_FORMATS as a list."""
+        """Parse SUPPORTED_VIDEO_FORMATS as a list (once per instance)."""
         return [fmt.strip() for fmt in self.SUPPORTED_VIDEO_FORMATS.split(",")]
 
     def ensure_directories(self):
@@ -60,5 +61,7 @@ class Settings(BaseSettings):
         Path(self.LOGS_PATH).mkdir(parents=True, exist_ok=True)
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment on first use."""
+    return Settings()
@@ -2,15 +2,25 @@
 Logging configuration for the application.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+# Background thread that owns the real handlers (see setup_logging)
+_listener: Optional[QueueListener] = None
 
 
 def setup_logging(log_level: str = "INFO", log_file: str = "logs/app.log") -> None:
     """
     Configure logging for the application.
+
+    The root logger only gets a QueueHandler; console and file output are
+    written by a QueueListener thread so request threads never block on I/O.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to the log file
@@ -23,7 +33,11 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/app.log") -> No
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Clear existing handlers
+    # Clear existing handlers (and stop a listener from an earlier call)
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     logger.handlers.clear()
 
     # Console handler
@@ -34,11 +48,10 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/app.log") -> No
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
 
     # File handler (rotating)
     file_handler = RotatingFileHandler(
-        log_file, maxBytes=50000 * 1024 * 1024, backupCount=5
+        log_file, maxBytes=50 * 1024 * 1024, backupCount=5, delay=True
     )
     file_handler.setLevel(logging.DEBUG)
     file_format = logging.Formatter(
@@ -46,10 +59,25 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/app.log") -> No
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     logger.info("Logging configured successfully")
 
 
+def _stop_listener() -> None:
+    """Flush queued records on interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
@@ -2,14 +2,113 @@
 YouTube video download utilities using yt-dlp.
 """
 
+import asyncio
 import logging
-import uuid
+import os
+import re
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
-import yt_dlp
+
+try:
+    import re2 as _url_re  # Optional google-re2: linear-time DFA matching
+except ImportError:
+    _url_re = re
 
 logger = logging.getLogger(__name__)
 
+# Downloads block for minutes on network and disk, so they get their own pool
+# instead of the event loop's default executor shared with other blocking calls
+DOWNLOAD_WORKERS = int(os.getenv("YOUTUBE_DOWNLOAD_WORKERS", "2"))
+_download_executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="yt-download")
+
+# Output directories already created by this process (skips repeat mkdir calls)
+_MKDIR_CACHE: set = set()
+_mkdir_lock = threading.Lock()
+
+# Longest video accepted for download (cricket matches can be very long)
+MAX_DURATION_SECONDS = 8 * 60 * 60
+
+# One anchored pass validates the URL and captures the video ID (RE2 when available)
+_YOUTUBE_URL_RE = _url_re.compile(
+    r'^(?:https?://)?(?:www\.)?'
+    r'(?:youtube(?:-nocookie)?\.com/(?:watch\?v=|embed/|v/|shorts/|live/)|youtu\.be/)'
+    r'(?P<id>[0-9A-Za-z_-]{11})'
+)
+
+# Canonical URL prefixes whose ID can be sliced without a regex
+_YT_ID_PREFIXES = ('https://youtu.be/', 'https://www.youtube.com/watch?v=')
+_YT_ID_CHARS = frozenset('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_-')
+
+
+# yt-dlp DownloadError classification: one scan of the message, mapped to the
+# user-facing text. Checked in this order when several kinds match.
+_ERR_RE = re.compile(
+    r'(?P<unavailable>unavailable)|(?P<copyright>copyright)|(?P<age>age[- ]?restrict|confirm your age)',
+    re.IGNORECASE,
+)
+_ERR_MAP = {
+    'unavailable': "Video is unavailable or private. Please check the URL.",
+    'copyright': "Video cannot be downloaded due to copyright restrictions.",
+    'age': "Age-restricted video cannot be downloaded.",
+}
+
+
+# Browser profile locations yt-dlp reads cookies from (Linux, macOS, Windows)
+_BROWSER_PROFILE_DIRS = {
+    'chrome': (
+        '~/.config/google-chrome',
+        '~/Library/Application Support/Google/Chrome',
+        '~/AppData/Local/Google/Chrome/User Data',
+    ),
+    'firefox': (
+        '~/.mozilla/firefox',
+        '~/Library/Application Support/Firefox',
+        '~/AppData/Roaming/Mozilla/Firefox',
+    ),
+}
+
+# Cookie source of the last successful download (None = no cookies); tried first
+_LAST_GOOD_STRATEGY: Optional[str] = None
+
+
+def _browser_available(name: str) -> bool:
+    """Return True if a profile directory for the browser exists on this host."""
+    return any(Path(p).expanduser().exists() for p in _BROWSER_PROFILE_DIRS.get(name, ()))
+
+
+class _YDLLogger:
+    """Route yt-dlp output to the module logger instead of writing to stdout."""
+
+    def debug(self, msg: str) -> None:
+        # yt-dlp sends info-level lines through debug() without the prefix
+        if msg.startswith('[debug] '):
+            logger.debug(msg)
+        else:
+            logger.info(msg)
+
+    def info(self, msg: str) -> None:
+        logger.info(msg)
+
+    def warning(self, msg: str) -> None:
+        logger.warning(msg)
+
+    def error(self, msg: str) -> None:
+        logger.error(msg)
+
+
+_ydl_logger = _YDLLogger()
+
+
+def _reject_too_long(info: Dict[str, any], *, incomplete: bool = False) -> Optional[str]:
+    """yt-dlp match_filter: skip the download when the video exceeds the limit."""
+    duration = info.get('duration')
+    if duration and duration > MAX_DURATION_SECONDS:
+        return 'too long'
+    return None
+
 
 def download_youtube_video(
     url: str,
@@ -22,7 +121,7 @@ def download_youtube_video(
     Args:
         url: YouTube video URL
         output_dir: Directory to save the downloaded video
-        video_id: Optional custom video ID (generates UUID if not provided)
+        video_id: Optional custom video ID (generates a random 16-char ID if not provided)
     
     Returns:
         Dictionary containing:
@@ -35,23 +134,47 @@ def download_youtube_video(
     Raises:
         Exception: If download fails
     """
+    global _LAST_GOOD_STRATEGY
+    
+    # Imported here: yt_dlp loads ~1800 extractor modules, which only downloads need
+    import yt_dlp
+    
     if not video_id:
-        video_id = str(uuid.uuid4())
+        video_id = secrets.token_urlsafe(12)
     
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if output_dir not in _MKDIR_CACHE:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with _mkdir_lock:
+            _MKDIR_CACHE.add(output_dir)
     
     # Base yt-dlp configuration (NO cookies here - added per-attempt)
+    # Final size of each file yt-dlp finishes writing, keyed by path. Local to
+    # this call so concurrent downloads don't share state.
+    finished_sizes: Dict[str, int] = {}
+    
+    def _record_finished(d: Dict[str, any]) -> None:
+        if d.get('status') == 'finished' and d.get('filename'):
+            size = d.get('total_bytes') or d.get('downloaded_bytes')
+            if size:
+                finished_sizes[d['filename']] = size
+    
     base_ydl_opts = {
+        'progress_hooks': [_record_finished],
         'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
         'outtmpl': str(output_dir / f'{video_id}.%(ext)s'),
-        'quiet': False,
-        'no_warnings': False,
+        'logger': _ydl_logger,
+        'quiet': True,
+        'no_warnings': True,
+        'noprogress': True,
         'extract_flat': False,
+        # The merger stream-copies into mp4. The remuxer only rewraps a non-mp4
+        # "best" fallback (-c copy, skipped for mp4); nothing is re-encoded.
         'merge_output_format': 'mp4',
         'postprocessors': [{
-            'key': 'FFmpegVideoConvertor',
+            'key': 'FFmpegVideoRemuxer',
             'preferedformat': 'mp4',
         }],
+        'match_filter': _reject_too_long,
         # Download restrictions
         'max_filesize': 12 * 1024 * 1024 * 1024,  # 12GB max for cricket matches
         
@@ -67,46 +190,60 @@ def download_youtube_video(
         'nocheckcertificate': True,
         'socket_timeout': 30,
         'ignoreerrors': False,  # Fail fast on errors
+        
+        # Throughput: fetch DASH/HLS fragments in parallel and retry transient
+        # failures instead of restarting the whole download
+        'concurrent_fragment_downloads': 8,
+        'retries': 10,
+        'fragment_retries': 10,
+        'http_chunk_size': 10 * 1024 * 1024,  # 10MB ranges avoid YouTube throttling
+        
+        # yt-dlp defaults, stated explicitly: the cookie-strategy retries rely
+        # on resuming the .part file left by a failed attempt
+        'continuedl': True,
+        'nopart': False,
     }
     
     try:
         logger.info(f"Downloading YouTube video: {url}")
         
-        # Try multiple methods in sequence (cookies → no cookies)
+        # Try multiple methods in sequence (cookies → no cookies), skipping
+        # browsers that aren't installed here. None means no cookies -
+        # Android client emulation only (works on Render).
+        strategies = [b for b in ('chrome', 'firefox') if _browser_available(b)] + [None]
+        if _LAST_GOOD_STRATEGY in strategies:
+            strategies.remove(_LAST_GOOD_STRATEGY)
+            strategies.insert(0, _LAST_GOOD_STRATEGY)
+        
         download_attempts = [
-            # Attempt 1: Chrome cookies (if available)
-            {**base_ydl_opts, 'cookiesfrombrowser': ('chrome',)},
-            # Attempt 2: Firefox cookies (if available)  
-            {**base_ydl_opts, 'cookiesfrombrowser': ('firefox',)},
-            # Attempt 3: No cookies - Android client emulation only (works on Render)
-            base_ydl_opts,
+            {**base_ydl_opts, 'cookiesfrombrowser': (browser,)} if browser else base_ydl_opts
+            for browser in strategies
         ]
         
         last_error = None
-        for attempt_num, attempt_opts in enumerate(download_attempts, 1):
+        for attempt_num, (strategy, attempt_opts) in enumerate(zip(strategies, download_attempts), 1):
             try:
-                logger.info(f"Download attempt {attempt_num}/{len(download_attempts)}")
+                logger.info(f"Download attempt {attempt_num}/{len(download_attempts)} "
+                            f"(cookies: {strategy or 'none'})")
                 
                 with yt_dlp.YoutubeDL(attempt_opts) as ydl:
-                    # Extract info without downloading first (to validate and get metadata)
-                    info = ydl.extract_info(url, download=False)
+                    # One extraction; match_filter skips the transfer for
+                    # videos over the duration limit
+                    info = ydl.extract_info(url, download=True)
                     
                     if not info:
                         raise ValueError("Could not extract video information")
                     
                     title = info.get('title', 'Unknown Title')
-                    duration = info.get('duration', 0)
+                    duration = info.get('duration') or 0
                     
                     logger.info(f"Video info: {title} ({duration}s)")
                     
-                    # Check duration (cricket matches can be very long)
-                    if duration > 28800:  # 8 hours max
+                    if duration > MAX_DURATION_SECONDS:
                         raise ValueError("Video is too long (max 8 hours). Consider trimming before upload.")
                     
-                    # Now download
-                    ydl.download([url])
-                    
                     # If we reach here, download succeeded
+                    _LAST_GOOD_STRATEGY = strategy
                     break
                     
             except Exception as e:
@@ -118,14 +255,33 @@ def download_youtube_video(
                     # All attempts failed, raise the last error
                     raise last_error
         
-        # Find the downloaded file (yt-dlp may add different extensions)
-        downloaded_files = list(output_dir.glob(f"{video_id}.*"))
+        # yt-dlp reports the final path; scan the directory only as a fallback
+        requested = info.get('requested_downloads') or []
+        file_path = Path(requested[0]['filepath']) if requested and requested[0].get('filepath') else None
+        file_size = None
         
-        if not downloaded_files:
-            raise FileNotFoundError(f"Downloaded file not found for video_id: {video_id}")
+        if file_path is not None:
+            # Single-file downloads are reported by the progress hook; merged
+            # output is written by the postprocessor, so stat it instead
+            file_size = finished_sizes.get(str(file_path))
+        
+        if file_path is not None and file_size is None:
+            try:
+                file_size = file_path.stat().st_size
+            except FileNotFoundError:
+                file_path = None
         
-        file_path = downloaded_files[0]
-        file_size = file_path.stat().st_size
+        if file_path is None:
+            # yt-dlp may add different extensions
+            prefix = f"{video_id}."
+            with os.scandir(output_dir) as entries:
+                entry = next((e for e in entries if e.name.startswith(prefix)), None)
+            
+            if entry is None:
+                raise FileNotFoundError(f"Downloaded file not found for video_id: {video_id}")
+            
+            file_path = Path(entry.path)
+            file_size = entry.stat().st_size
         
         logger.info(f"Successfully downloaded: {file_path} ({file_size} bytes)")
         
@@ -141,15 +297,12 @@ def download_youtube_video(
         error_msg = str(e)
         logger.error(f"yt-dlp download error: {error_msg}")
         
-        # Provide user-friendly error messages
-        if 'unavailable' in error_msg.lower():
-            raise Exception("Video is unavailable or private. Please check the URL.")
-        elif 'copyright' in error_msg.lower():
-            raise Exception("Video cannot be downloaded due to copyright restrictions.")
-        elif 'age' in error_msg.lower():
-            raise Exception("Age-restricted video cannot be downloaded.")
-        else:
-            raise Exception(f"Failed to download video: {error_msg}")
+        # Provide user-friendly error messages (first matching kind in _ERR_MAP order)
+        found = {m.lastgroup for m in _ERR_RE.finditer(error_msg)}
+        kind = next((k for k in _ERR_MAP if k in found), None)
+        if kind:
+            raise Exception(_ERR_MAP[kind])
+        raise Exception(f"Failed to download video: {error_msg}")
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         raise Exception(str(e))
@@ -161,6 +314,43 @@ def download_youtube_video(
         raise Exception(f"Unexpected error during download: {str(e)}")
 
 
+async def download_youtube_video_async(
+    url: str,
+    output_dir: Path,
+    video_id: Optional[str] = None,
+) -> Dict[str, any]:
+    """
+    Run download_youtube_video on the download pool without blocking the event loop.
+    
+    Takes the same arguments and returns the same dictionary as download_youtube_video.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _download_executor, download_youtube_video, url, output_dir, video_id
+    )
+
+
+def parse_youtube_url(url: str) -> Optional[str]:
+    """
+    Validate a YouTube URL and extract its video ID in one pass.
+    
+    Args:
+        url: URL string to parse
+    
+    Returns:
+        YouTube video ID, or None if the URL is not a YouTube video link
+    """
+    for prefix in _YT_ID_PREFIXES:
+        if url.startswith(prefix):
+            candidate = url[len(prefix):len(prefix) + 11]
+            if len(candidate) == 11 and _YT_ID_CHARS.issuperset(candidate):
+                return candidate
+            break
+    
+    match = _YOUTUBE_URL_RE.match(url)
+    return match.group('id') if match else None
+
+
 def validate_youtube_url(url: str) -> bool:
     """
     Validate if a URL is a valid YouTube URL.
@@ -171,16 +361,7 @@ def validate_youtube_url(url: str) -> bool:
     Returns:
         True if valid YouTube URL, False otherwise
     """
-    import re
-    
-    youtube_regex = (
-        r'(https?://)?(www\.)?'
-        r'(youtube|youtu|youtube-nocookie)\.(com|be)/'
-        r'(watch\?v=|embed/|v/|.+\?v=)?([^&=%\?]{11})'
-    )
-    
-    match = re.match(youtube_regex, url)
-    return bool(match)
+    return parse_youtube_url(url) is not None
 
 
 def extract_video_id_from_url(url: str) -> Optional[str]:
@@ -193,18 +374,4 @@ def extract_video_id_from_url(url: str) -> Optional[str]:
     Returns:
         YouTube video ID or None if not found
     """
-    import re
-    
-    # Pattern to match various YouTube URL formats
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',
-        r'(?:watch\?v=)([0-9A-Za-z_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    return parse_youtube_url(url)
@@ -11,8 +11,6 @@ Usage:
 """
 import sys
 from pathlib import Path
-from api.routes import player
-app.include_router(player.router)
 
 
 # Add backend/scripts to Python path for imports